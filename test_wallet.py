@@ -8,9 +8,8 @@ from wallet import Record, Wallet, validate_date
 def wallet(tmp_path):
     # Define the path to the temporary wallet file
     test_wallet_file = tmp_path / "wallet.txt"
-    # Initialize the file with an empty list to ensure valid JSON structure
-    with open(test_wallet_file, 'w') as f:
-        json.dump([], f)
+    # Start from an empty file; records are stored one JSON object per line
+    test_wallet_file.touch()
     # Create a Wallet instance with the path to the temporary file
     return Wallet(filename=str(test_wallet_file))
 
@@ -25,6 +24,103 @@ def test_validate_date():
     assert validate_date("2023-01-01") is True
     assert validate_date("01-01-2023") is False
 
+def test_find_records_by_amount(wallet):
+    record = Record("2023-01-01", "Income", 1000.0, "Salary")
+    wallet.add_record(record)
+    wallet.add_record(Record("2023-01-02", "Expense", 50.0, "Coffee"))
+    found_records = wallet.find_records("1000")
+    assert len(found_records) == 1
+    assert found_records[0].to_dict() == record.to_dict()
+
+def test_iter_raw_yields_tuples(wallet):
+    wallet.add_record(Record("2023-01-01", "Income", 1000.0, "Salary"))
+    wallet.flush()
+    # A fresh wallet can stream raw rows without building Record objects
+    fresh = Wallet(filename=wallet.filename)
+    assert list(fresh.iter_raw()) == [("2023-01-01", "Income", 1000.0, "Salary")]
+
+def test_buffered_writes_flush_on_close(tmp_path):
+    wallet_file = tmp_path / "wallet.txt"
+    with Wallet(filename=str(wallet_file)) as wallet:
+        wallet.add_record(Record("2023-01-01", "Income", 1000.0, "Salary"))
+    # Leaving the context flushes the write-behind buffer to disk
+    reloaded = Wallet(filename=str(wallet_file))
+    assert len(reloaded.records) == 1
+
+def test_legacy_array_file_migrates_on_load(tmp_path):
+    wallet_file = tmp_path / "wallet.txt"
+    # The pre-JSONL format: one indented JSON array spanning the whole file
+    with open(wallet_file, 'w') as f:
+        json.dump([{"date": "2023-01-01", "category": "Income",
+                    "amount": 1000.0, "description": "Salary"}], f, indent=4)
+    with Wallet(filename=str(wallet_file)) as wallet:
+        assert len(wallet.records) == 1
+        wallet.add_record(Record("2023-01-02", "Expense", 50.0, "Coffee"))
+    # Loading rewrote the file as JSON Lines, so the append is not lost
+    reloaded = Wallet(filename=str(wallet_file))
+    assert len(reloaded.records) == 2
+
+def test_legacy_array_with_appended_lines_is_recovered(tmp_path):
+    wallet_file = tmp_path / "wallet.txt"
+    # A file left behind by the migration bug: a legacy array with JSON
+    # Lines appended after it
+    with open(wallet_file, 'w') as f:
+        json.dump([{"date": "2023-01-01", "category": "Income",
+                    "amount": 1000.0, "description": "Salary"}], f, indent=4)
+        f.write('\n["2023-01-02","Expense",50.0,"Coffee"]\n')
+    wallet = Wallet(filename=str(wallet_file))
+    assert len(wallet.records) == 2
+    assert wallet.records[1].description == "Coffee"
+
+def test_torn_trailing_line_is_dropped(tmp_path):
+    wallet_file = tmp_path / "wallet.txt"
+    # One complete row plus an append cut short by a crash
+    with open(wallet_file, 'w') as f:
+        f.write('["2023-01-01","Income",1000.0,"Salary"]\n')
+        f.write('["2023-01-02","Exp')
+    with Wallet(filename=str(wallet_file)) as wallet:
+        assert len(wallet.records) == 1
+        wallet.add_record(Record("2023-01-03", "Expense", 50.0, "Coffee"))
+    # The torn line was compacted away, so the new append replays cleanly
+    reloaded = Wallet(filename=str(wallet_file))
+    assert len(reloaded.records) == 2
+
+def test_corrupt_file_is_reset_before_appending(tmp_path):
+    wallet_file = tmp_path / "wallet.txt"
+    with open(wallet_file, 'w') as f:
+        f.write('not json at all\n')
+    with Wallet(filename=str(wallet_file)) as wallet:
+        assert len(wallet.records) == 0
+        wallet.add_record(Record("2023-01-01", "Income", 1000.0, "Salary"))
+    # The garbage was compacted away, so the new record survives a reopen
+    reloaded = Wallet(filename=str(wallet_file))
+    assert len(reloaded.records) == 1
+
+def test_record_order_survives_reload_after_edit(wallet):
+    # Enough records that the edit does not push tombstones past the
+    # compaction threshold
+    for day in range(1, 9):
+        wallet.add_record(Record(f"2023-01-0{day}", "Expense", float(day), f"Item {day}"))
+    wallet.edit_record(0, Record("2023-01-01", "Expense", 99.0, "Edited"))
+    assert wallet.records[0].description == "Edited"
+    wallet.flush()
+    # Replay must keep the edited record at its original position
+    reloaded = Wallet(filename=wallet.filename)
+    assert reloaded.records[0].description == "Edited"
+    assert [record.description for record in reloaded.records] == \
+           [record.description for record in wallet.records]
+
+def test_records_survive_reload(wallet):
+    record1 = Record("2023-01-01", "Income", 1000.0, "Salary")
+    record2 = Record("2023-02-01", "Expense", 500.0, "Groceries")
+    wallet.add_record(record1)
+    wallet.add_record(record2)
+    wallet.remove_record(0)
+    # Every mutation appended one line; reloading replays the log
+    reloaded = Wallet(filename=wallet.filename)
+    assert len(reloaded.records) == 1
+    assert reloaded.records[0].to_dict() == record2.to_dict()
+
 def test_removing_a_record(wallet):
     record1 = Record("2023-01-01", "Income", 1000.0, "Salary")
     record2 = Record("2023-02-01", "Expense", 500.0, "Groceries")
@@ -48,6 +144,15 @@ def test_record_string_representation():
     expected_string = "2023-01-01 - Income - 1000.0 - Salary"
     assert str(record) == expected_string
 
+def test_display_balance(wallet, capsys):
+    wallet.add_record(Record("2023-01-01", "Доход", 1000.0, "Зарплата"))
+    wallet.add_record(Record("2023-01-02", "Расход", 300.0, "Продукты"))
+    wallet.display_balance()
+    output = capsys.readouterr().out
+    assert "Баланс: 700.0" in output
+    assert "Доходы: 1000.0" in output
+    assert "Расходы: 300.0" in output
+
 def test_load_records_from_empty_file(tmp_path):
     empty_wallet_file = tmp_path / "empty_wallet.txt"
     # Ensure the file exists but is empty
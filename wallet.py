@@ -1,186 +1,545 @@
-import datetime
-import json
-from operator import indexOf
-
-class Record:
-    def __init__(self, date: str, category: str, amount: float, description: str) -> None:
-        if not isinstance(date, str) or not isinstance(category, str) or \
-        not isinstance(amount, (int, float)) or not isinstance(description, str):
-            raise TypeError("Invalid data type provided to Record constructor")
-        self.date = date
-        self.category = category
-        self.amount = amount
-        self.description = description
-
-    def __str__(self) -> str:
-        return f"{self.date} - {self.category} - {self.amount} - {self.description}"
-
-    def to_dict(self) -> dict[str, str]:
-        """
-        Returns a dictionary representation of the record.
-        """
-        return {
-            "date": self.date,
-            "category": self.category,
-            "amount": self.amount,
-            "description": self.description
-        }
-
-    @staticmethod
-    def from_dict(data: dict[str, str]) -> 'Record':
-        """
-        Converts a dictionary representation of a Record object back into a Record object.
-        """
-        return Record(data['date'], data['category'], data['amount'], data['description'])
-
-class Wallet:
-    def __init__(self, filename: str = 'wallet.txt') -> None:
-        """
-        Initializes a new Wallet object with the given filename for storing records.
-        """
-        self.filename = filename
-        self.records: list[Record] = []
-        self.load_records()
-
-    def add_record(self, record: Record) -> None:
-        """
-        Adds a new record to the wallet.
-        """
-        self.records.append(record)
-        self.save_records()
-
-    def edit_record(self, index: int, new_record: Record) -> bool:
-        """
-        Edits a record at the specified index in the wallet.
-        """
-        if 0 <= index < len(self.records):
-            self.records[index] = new_record
-            self.save_records()
-            return True
-        return False
-
-    def find_records(self, search_term: str) -> list[Record]:
-        """
-        Finds records in the wallet that match the given search term.
-        """
-        found_records = [record for record in self.records if
-                        search_term.lower() in record.description.lower() or
-                        search_term.lower() in record.category.lower() or
-                        search_term.lower() in str(record.amount).lower() or
-                        search_term.lower() == record.date.lower()]  # Perform an exact match on the date field
-        return found_records
-    
-    def remove_record(self, index: int) -> bool:
-        if 0 <= index < len(self.records):
-            del self.records[index]
-            self.save_records()
-            return True
-        return False
-
-    def display_balance(self) -> None:
-        """
-        Displays the current balance, total income, and total expenses in the wallet.
-        """
-        income = sum(record.amount for record in self.records if record.category.lower() == 'доход')
-        expense = sum(record.amount for record in self.records if record.category.lower() == 'расход')
-        balance = income - expense
-        print(f"\nБаланс: {balance}\nДоходы: {income}\nРасходы: {expense}")
-
-    def save_records(self) -> None:
-        """
-        Saves the records to the specified file in JSON format.
-        """
-        with open(self.filename, 'w', encoding='utf-8') as f:
-            json.dump([record.to_dict() for record in self.records], f, ensure_ascii=False, indent=4)
-
-    def load_records(self) -> None:
-        """
-        Loads the records from the specified file in JSON format.
-        """
-        try:
-            with open(self.filename, 'r', encoding='utf-8') as f:
-                self.records = [Record.from_dict(record) for record in json.load(f)]
-        except FileNotFoundError:
-            self.records = []
-        except json.JSONDecodeError:  # Catch the JSONDecodeError for empty files
-            self.records = []
-
-def validate_date(date_text: str) -> bool:
-    """
-    Checks if the given date_text is a valid date in the format 'YYYY-MM-DD'.
-    """
-    try:
-        datetime.datetime.strptime(date_text, '%Y-%m-%d')
-        return True
-    except ValueError:
-        return False
-
-def main():
-    """
-    Main function that runs the wallet application.
-    """
-    wallet = Wallet()
-    while True:
-        print("\n1. Показать баланс\n2. Добавить запись\n3. Редактировать запись\n4. Поиск по записям\n5. Выход")
-        choice = input("Выберите действие: ")
-        if choice == '1':
-            wallet.display_balance()
-        elif choice == '2':
-            date = input("\nДобавление записи:\nДата (YYYY-MM-DD): ")
-            while not validate_date(date):
-                print("Неверный формат даты. Пожалуйста, используйте формат YYYY-MM-DD.")
-                date = input("Дата (YYYY-MM-DD): ")
-            category = input("Категория (Доход/Расход): ")
-            amount_input = input("Сумма: ")
-            try:
-                amount = float(amount_input)
-            except ValueError:
-                print("Неверный формат суммы. Пожалуйста, введите число.")
-                continue
-            description = input("Описание: ")
-            wallet.add_record(Record(date, category, amount, description))
-            print("Запись добавлена.")
-        elif choice == '3':
-            index_input = input("\nВведите номер записи для редактирования: ")
-            try:
-                index = int(index_input) - 1  # Assuming user input is 1-based index
-            except ValueError:
-                print("Неверный формат номера записи. Пожалуйста, введите число.")
-                continue
-            if 0 <= index < len(wallet.records):
-                date = input("Новая дата (YYYY-MM-DD): ")
-                while not validate_date(date):
-                    print("Неверный формат даты. Пожалуйста, используйте формат YYYY-MM-DD.")
-                    date = input("Новая дата (YYYY-MM-DD): ")
-                category = input("Новая категория (Доход/Расход): ")
-                amount_input = input("Новая сумма: ")
-                try:
-                    amount = float(amount_input)
-                except ValueError:
-                    print("Неверный формат суммы. Пожалуйста, введите число.")
-                    continue
-                description = input("Новое описание: ")
-                if wallet.edit_record(index, Record(date, category, amount, description)):
-                    print("Запись обновлена.")
-                else:
-                    print("Ошибка: запись не найдена.")
-            else:
-                print("Запись с таким номером не найдена.")
-
-        elif choice == '4':
-            search_term = input("Введите критерий поиска (дата, категория, сумма, описание): ")
-            found_records = wallet.find_records(search_term)
-            if found_records:
-                for record in found_records:
-                    print(f"{indexOf(found_records, record)} - {record.date} - {record.category} - {record.amount} - {record.description}")
-            else:
-                print("Записи не найдены.")
-
-        elif choice == '5':
-            print("Выход из программы.")
-            break
-        else:
-            print("Неверный выбор. Пожалуйста, попробуйте снова.")
-
-if __name__ == "__main__":
+import datetime
+import json
+import os
+import re
+import sys
+from array import array
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import compress
+from operator import attrgetter, methodcaller
+
+import orjson
+
+# Larger-than-default I/O buffers: fewer write() syscalls when compacting,
+# fewer read() syscalls when replaying the log.
+_WRITE_BUFFER_SIZE = 262144  # 256 KiB
+_READ_BUFFER_SIZE = 65536  # 64 KiB
+
+# Appended lines are coalesced in memory and written out in batches of this
+# size; one large write replaces dozens of small synced ones.
+_FLUSH_BATCH = 64
+
+# Compiled once; validate_date only needs the calendar check for strings
+# that already have the right shape.
+_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+# Categories encoded as small ints at insert time, so balance scans compare
+# ints instead of lowercasing strings on every pass. The canonical category
+# strings are interned so repeated categories share one object.
+_CAT_INCOME = sys.intern('доход')
+_CAT_EXPENSE = sys.intern('расход')
+_INCOME_ID = 0
+_EXPENSE_ID = 1
+_OTHER_ID = 2
+_CATEGORY_IDS = {_CAT_INCOME: _INCOME_ID, _CAT_EXPENSE: _EXPENSE_ID}
+
+def _category_id(category: str) -> int:
+    """
+    Maps a category name to its small-int id (income, expense or other).
+    """
+    return _CATEGORY_IDS.get(category.lower(), _OTHER_ID)
+
+def _record_row(record: 'Record') -> tuple:
+    """
+    The positional on-disk form of a record: [date, category, amount, description].
+
+    A plain array avoids serializing four key strings per record.
+    """
+    return (record.date, record.category, record.amount, record.description)
+
+def _row_from_dict(data: dict) -> tuple:
+    """
+    Converts the legacy key/value record form into a positional row.
+    """
+    return (data['date'], data['category'], data['amount'], data['description'])
+
+def _apply_log_entry(live: dict[int, tuple], seq: int, tombstones: int,
+                     entry) -> tuple[int, int]:
+    """
+    Applies one parsed log entry to the live-row mapping and returns the
+    updated sequence number and tombstone count.
+    """
+    if isinstance(entry, list):
+        if entry and isinstance(entry[0], dict):
+            # Legacy single-line array of record objects
+            for d in entry:
+                live[seq] = _row_from_dict(d)
+                seq += 1
+        elif entry:
+            live[seq] = tuple(entry)
+            seq += 1
+        # An empty array line is a legacy empty wallet
+    elif isinstance(entry, dict):
+        if 'tombstone' in entry:
+            live.pop(entry['tombstone'], None)
+            tombstones += 1
+        elif 'replace' in entry:
+            # An edit: the row takes the edited record's place in the mapping
+            if entry['replace'] in live:
+                live[entry['replace']] = tuple(entry['row'])
+            tombstones += 1
+        else:  # Older lines stored records as key/value objects
+            live[seq] = _row_from_dict(entry)
+            seq += 1
+    # Scalar lines are not wallet entries; skip them
+    return seq, tombstones
+
+def _replay_legacy(content: bytes) -> tuple[dict[int, tuple], int, int]:
+    """
+    Replays a legacy file: one JSON array, possibly followed by JSON Lines
+    that a newer version appended before the file was migrated.
+    """
+    text = content.decode('utf-8')
+    # raw_decode stops at the end of the array instead of rejecting the
+    # whole file because of the appended lines
+    entries, end = json.JSONDecoder().raw_decode(text)
+    if not isinstance(entries, list) or \
+            not all(isinstance(d, dict) for d in entries):
+        # Not the legacy format after all; refuse rather than misread it
+        raise json.JSONDecodeError("not a legacy wallet array", text, 0)
+    live: dict[int, tuple] = {}
+    seq = 0
+    tombstones = 0
+    for d in entries:
+        live[seq] = _row_from_dict(d)
+        seq += 1
+    for line in text[end:].splitlines():
+        line = line.strip()
+        if line:
+            seq, tombstones = _apply_log_entry(live, seq, tombstones,
+                                               orjson.loads(line))
+    return live, seq, tombstones
+
+@dataclass(slots=True, frozen=True)
+class Record:
+    date: str
+    category: str
+    amount: float
+    description: str
+    # Lowercase haystack built once, so searches need no per-field .lower()
+    _search_blob: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, '_search_blob',
+            f"{self.category.lower()}\x1f{self.amount}\x1f{self.description.lower()}")
+
+    def __str__(self) -> str:
+        return f"{self.date} - {self.category} - {self.amount} - {self.description}"
+
+    def to_dict(self) -> dict[str, str]:
+        """
+        Returns a dictionary representation of the record.
+        """
+        return {
+            "date": self.date,
+            "category": self.category,
+            "amount": self.amount,
+            "description": self.description
+        }
+
+    @staticmethod
+    def from_dict(data: dict[str, str]) -> 'Record':
+        """
+        Converts a dictionary representation of a Record object back into a Record object.
+        """
+        return Record(data['date'], data['category'], data['amount'], data['description'])
+
+class Wallet:
+    def __init__(self, filename: str = 'wallet.txt', autoflush: bool = False) -> None:
+        """
+        Initializes a new Wallet object with the given filename for storing records.
+
+        Records are stored in JSON Lines format: one JSON object per line,
+        appended as records are added. Edits and removals append a tombstone
+        line instead of rewriting the file; the file is compacted once
+        tombstones pile up.
+
+        Appended lines are buffered in memory and flushed in batches; use the
+        wallet as a context manager (or call close/flush) to guarantee the
+        buffer reaches disk. Pass autoflush=True to write through on every
+        mutation instead.
+
+        The file is not parsed here: loading is deferred until the records
+        are first needed.
+        """
+        self.filename = filename
+        self.autoflush = autoflush
+        self._pending: list[str] = []  # Lines waiting for the next flush
+        self._records: list[Record] | None = None  # Parsed lazily on demand
+        self._amounts: array = array('d')  # Amounts as a packed float column
+        self._cat_ids: array = array('b')  # Category ids parallel to records
+        self._by_date: dict[str, list[Record]] = {}  # Date -> records index
+        self._by_amount: dict[float, list[Record]] = {}  # Amount -> records index
+        self._seqs: list[int] = []  # Append sequence number of each live record
+        self._next_seq = 0
+        self._tombstones = 0
+        self._fh = None  # Lazily opened append-mode handle
+
+    @property
+    def records(self) -> list[Record]:
+        """
+        The live records, loading them from the file on first access.
+        """
+        if self._records is None:
+            self.load_records()
+        return self._records
+
+    def add_record(self, record: Record) -> None:
+        """
+        Adds a new record to the wallet and appends it to the file.
+        """
+        self.records.append(record)
+        self._amounts.append(record.amount)
+        self._cat_ids.append(_category_id(record.category))
+        self._index_record(record)
+        self._seqs.append(self._next_seq)
+        self._next_seq += 1
+        self._append_line(_record_row(record))
+
+    def edit_record(self, index: int, new_record: Record) -> bool:
+        """
+        Edits a record at the specified index in the wallet.
+
+        The replacement is logged against the old record's sequence number,
+        so replay keeps it at the same position in the list.
+        """
+        if 0 <= index < len(self.records):
+            self._unindex_record(self.records[index])
+            self.records[index] = new_record
+            self._amounts[index] = new_record.amount
+            self._cat_ids[index] = _category_id(new_record.category)
+            self._index_record(new_record)
+            self._append_line({"replace": self._seqs[index],
+                               "row": _record_row(new_record)})
+            self._tombstones += 1
+            self._maybe_compact()
+            return True
+        return False
+
+    def find_records(self, search_term: str) -> list[Record]:
+        """
+        Finds records in the wallet that match the given search term.
+        """
+        if self._records is None:
+            self.load_records()
+        if not search_term:
+            return list(self.records)  # An empty needle matches everything
+        if validate_date(search_term):
+            # Exact date queries are answered from the index in O(1)
+            return list(self._by_date.get(search_term, []))
+        try:
+            amount = float(search_term)
+        except ValueError:
+            pass
+        else:
+            # Numeric queries are exact amount lookups, also O(1)
+            return list(self._by_amount.get(amount, []))
+        needle = search_term.lower()
+        # The whole scan runs in C: attrgetter pulls the haystacks,
+        # methodcaller applies the substring test, compress keeps the hits.
+        blobs = map(attrgetter('_search_blob'), self.records)
+        selectors = map(methodcaller('__contains__', needle), blobs)
+        found_records = list(compress(self.records, selectors))
+        # Exact date matches come from the index, even for terms that did not
+        # validate as dates above
+        for record in self._by_date.get(search_term, []):
+            if needle not in record._search_blob:
+                found_records.append(record)
+        return found_records
+    
+    def remove_record(self, index: int) -> bool:
+        if 0 <= index < len(self.records):
+            self._append_line({"tombstone": self._seqs[index]})
+            self._unindex_record(self.records[index])
+            del self.records[index]
+            del self._amounts[index]
+            del self._cat_ids[index]
+            del self._seqs[index]
+            self._tombstones += 1
+            self._maybe_compact()
+            return True
+        return False
+
+    def display_balance(self) -> None:
+        """
+        Displays the current balance, total income, and total expenses in the wallet.
+        """
+        if self._records is None:
+            # Not loaded yet: aggregate straight off the raw rows without
+            # materializing any Record objects
+            pairs = ((_category_id(row[1]), row[2]) for row in self.iter_raw())
+        else:
+            pairs = zip(self._cat_ids, self._amounts)
+        income = 0.0
+        expense = 0.0
+        # Single pass; no per-record string work on the loaded path
+        for cat_id, amount in pairs:
+            if cat_id == _INCOME_ID:
+                income += amount
+            elif cat_id == _EXPENSE_ID:
+                expense += amount
+        balance = income - expense
+        print(f"\nБаланс: {balance}\nДоходы: {income}\nРасходы: {expense}")
+
+    def _index_record(self, record: Record) -> None:
+        """
+        Adds a record to the date and amount indexes.
+        """
+        self._by_date.setdefault(record.date, []).append(record)
+        self._by_amount.setdefault(record.amount, []).append(record)
+
+    def _unindex_record(self, record: Record) -> None:
+        """
+        Removes a record from the date and amount indexes.
+        """
+        for index, key in ((self._by_date, record.date),
+                           (self._by_amount, record.amount)):
+            bucket = index.get(key)
+            if bucket is not None:
+                bucket.remove(record)
+                if not bucket:
+                    del index[key]
+
+    def _append_line(self, entry: dict) -> None:
+        """
+        Queues a single JSON line for appending to the wallet file.
+        """
+        self._pending.append(orjson.dumps(entry).decode() + "\n")
+        if self.autoflush or len(self._pending) >= _FLUSH_BATCH:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Writes all buffered lines to the wallet file.
+        """
+        if not self._pending:
+            return
+        if self._fh is None:
+            self._fh = open(self.filename, 'a', encoding='utf-8',
+                            buffering=_WRITE_BUFFER_SIZE)
+        self._fh.writelines(self._pending)  # No joined copy of the batch
+        self._pending.clear()
+        self._fh.flush()
+        os.fsync(self._fh.fileno())  # One fsync amortized over the whole batch
+
+    def close(self) -> None:
+        """
+        Flushes any buffered lines and closes the wallet file.
+        """
+        self.flush()
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+
+    def __enter__(self) -> 'Wallet':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _maybe_compact(self) -> None:
+        """
+        Compacts the file once tombstones exceed a quarter of the live records.
+        """
+        if self._tombstones > len(self.records) // 4:
+            self.compact()
+
+    def compact(self) -> None:
+        """
+        Rewrites the file with only the live records, dropping tombstones.
+        """
+        self._pending.clear()  # The rewrite below supersedes any queued lines
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
+        # Write to a temp file, sync once, then rename: a crash mid-rewrite
+        # can never leave a truncated wallet behind.
+        tmp = self.filename + '.tmp'
+        with open(tmp, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+            f.writelines(orjson.dumps(_record_row(record)) + b"\n"
+                         for record in self.records)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.filename)
+        self._seqs = list(range(len(self.records)))
+        self._next_seq = len(self.records)
+        self._tombstones = 0
+
+    def _replay_rows(self) -> tuple[dict[int, tuple], int, int, bool]:
+        """
+        Replays the JSON Lines log into raw rows without building Records.
+
+        Returns the live (seq -> row) mapping, the next sequence number, the
+        tombstone count and whether the file needs rewriting (legacy format
+        or a torn trailing line). Files written by older versions as a
+        single JSON array are still read.
+        """
+        self.flush()  # Queued lines must hit the file before it is replayed
+        live: dict[int, tuple] = {}
+        seq = 0
+        tombstones = 0
+        needs_rewrite = False
+        parsed_any = False
+        try:
+            # Binary mode lets orjson parse the raw bytes of each line, and
+            # the buffered reader keeps the line iteration to few syscalls.
+            with open(self.filename, 'rb', buffering=_READ_BUFFER_SIZE) as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entry = orjson.loads(line)
+                    except orjson.JSONDecodeError:
+                        if parsed_any:
+                            # A torn trailing line from an interrupted append:
+                            # keep the rows recovered so far and drop it.
+                            needs_rewrite = True
+                            break
+                        # Legacy format: one indented JSON array spanning the
+                        # whole file (possibly with lines appended after it),
+                        # so the first line is not valid JSON on its own.
+                        f.seek(0)
+                        live, seq, tombstones = _replay_legacy(f.read())
+                        needs_rewrite = True
+                        break
+                    parsed_any = True
+                    seq, tombstones = _apply_log_entry(live, seq, tombstones,
+                                                       entry)
+        except FileNotFoundError:
+            pass
+        except json.JSONDecodeError:
+            # Treat a corrupt file as empty, but have it rewritten: leaving
+            # the garbage in place would swallow every line appended after it
+            # on the next replay.
+            live = {}
+            seq = 0
+            tombstones = 0
+            needs_rewrite = True
+        return live, seq, tombstones, needs_rewrite
+
+    def iter_raw(self):
+        """
+        Yields (date, category, amount, description) tuples for the live
+        records, straight from the file when they are not loaded yet.
+        """
+        if self._records is not None:
+            for record in self._records:
+                yield _record_row(record)
+            return
+        live, _, _, _ = self._replay_rows()
+        yield from live.values()
+
+    def load_records(self) -> None:
+        """
+        Loads the records from the specified file, replaying the JSON Lines log.
+        """
+        live, seq, tombstones, needs_rewrite = self._replay_rows()
+        self._records = [Record(date, sys.intern(category), amount, description)
+                         for date, category, amount, description in live.values()]
+        self._amounts = array('d', (record.amount for record in self._records))
+        self._cat_ids = array('b', (_category_id(record.category)
+                                    for record in self._records))
+        self._by_date = {}
+        self._by_amount = {}
+        for record in self._records:
+            self._index_record(record)
+        self._seqs = list(live.keys())
+        self._next_seq = seq
+        self._tombstones = tombstones
+        if needs_rewrite:
+            # Rewrite legacy or damaged files as clean JSON Lines right away:
+            # appending after a legacy array or a torn line would leave a
+            # file whose tail cannot be replayed on the next open.
+            self.compact()
+
+@lru_cache(maxsize=4096)
+def validate_date(date_text: str) -> bool:
+    """
+    Checks if the given date_text is a valid date in the format 'YYYY-MM-DD'.
+
+    Results are memoized: the same few date strings get validated over and
+    over by the input loop and by every find_records call.
+    """
+    # Reject anything that is not digits-and-hyphens up front, then let the
+    # date constructor do the calendar check; strptime re-parses its format
+    # string and builds a throwaway datetime on every call.
+    if _DATE_RE.fullmatch(date_text) is None:
+        return False
+    try:
+        datetime.date(int(date_text[0:4]), int(date_text[5:7]), int(date_text[8:10]))
+        return True
+    except ValueError:
+        return False
+
+def main():
+    """
+    Main function that runs the wallet application.
+    """
+    with Wallet() as wallet:
+        while True:
+            print("\n1. Показать баланс\n2. Добавить запись\n3. Редактировать запись\n4. Поиск по записям\n5. Выход")
+            choice = input("Выберите действие: ")
+            if choice == '1':
+                wallet.display_balance()
+            elif choice == '2':
+                date = input("\nДобавление записи:\nДата (YYYY-MM-DD): ")
+                while not validate_date(date):
+                    print("Неверный формат даты. Пожалуйста, используйте формат YYYY-MM-DD.")
+                    date = input("Дата (YYYY-MM-DD): ")
+                category = input("Категория (Доход/Расход): ")
+                amount_input = input("Сумма: ")
+                try:
+                    amount = float(amount_input)
+                except ValueError:
+                    print("Неверный формат суммы. Пожалуйста, введите число.")
+                    continue
+                description = input("Описание: ")
+                wallet.add_record(Record(date, category, amount, description))
+                print("Запись добавлена.")
+            elif choice == '3':
+                index_input = input("\nВведите номер записи для редактирования: ")
+                try:
+                    index = int(index_input) - 1  # Assuming user input is 1-based index
+                except ValueError:
+                    print("Неверный формат номера записи. Пожалуйста, введите число.")
+                    continue
+                if 0 <= index < len(wallet.records):
+                    date = input("Новая дата (YYYY-MM-DD): ")
+                    while not validate_date(date):
+                        print("Неверный формат даты. Пожалуйста, используйте формат YYYY-MM-DD.")
+                        date = input("Новая дата (YYYY-MM-DD): ")
+                    category = input("Новая категория (Доход/Расход): ")
+                    amount_input = input("Новая сумма: ")
+                    try:
+                        amount = float(amount_input)
+                    except ValueError:
+                        print("Неверный формат суммы. Пожалуйста, введите число.")
+                        continue
+                    description = input("Новое описание: ")
+                    if wallet.edit_record(index, Record(date, category, amount, description)):
+                        print("Запись обновлена.")
+                    else:
+                        print("Ошибка: запись не найдена.")
+                else:
+                    print("Запись с таким номером не найдена.")
+
+            elif choice == '4':
+                search_term = input("Введите критерий поиска (дата, категория, сумма, описание): ")
+                found_records = wallet.find_records(search_term)
+                if found_records:
+                    for i, record in enumerate(found_records):
+                        print(f"{i} - {record.date} - {record.category} - {record.amount} - {record.description}")
+                else:
+                    print("Записи не найдены.")
+
+            elif choice == '5':
+                print("Выход из программы.")
+                break
+            else:
+                print("Неверный выбор. Пожалуйста, попробуйте снова.")
+
+if __name__ == "__main__":
     main()
\ No newline at end of file